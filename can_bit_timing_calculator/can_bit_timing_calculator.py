@@ -57,11 +57,14 @@ So with the wbove example and with TSEG1 = 15 and TSEG2 = 4:
 
 """
 
+import math
 import sys
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, Tuple
 from PyQt5 import QtWidgets, QtCore, QtGui
 
 
@@ -83,11 +86,16 @@ class CanPhase(Enum):
     Data = 1
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class BitTiming:
     """
-    Calculated bit timing parameters
+    Calculated bit timing parameters (immutable, eq and hash are defined below)
     """
+    # no per instance __dict__: the GUI can hold hundreds of these
+    __slots__ = (
+        'SamplePoint', 'TimeQuantumSec', 'TimeQuantaPerBitTime', 'TS1', 'TS2', 'Prescaler', 'SyncJumpWidthActual',
+        '_key'
+    )
     # sample point location inside the bit time in [%]
     SamplePoint: float
     # length of a time quantum in [s]
@@ -109,22 +117,39 @@ class BitTiming:
         """
         return self.SamplePoint, self.SyncJumpWidthActual
 
+    def __post_init__(self):
+        # the instance is immutable, so the key tuple is built only once
+        object.__setattr__(self, '_key', self.__keys())
+
     def __eq__(self, other):
-        return self.__keys() == other.__keys()
+        return self._key == other._key
 
     def __hash__(self):
-        return hash(self.__keys())
+        return hash(self._key)
+
+    def __getstate__(self):
+        """
+        Frozen plus hand-written __slots__: copy and pickle need explicit state
+        methods, as the default ones would assign the fields through the frozen
+        __setattr__.
+        """
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
 
 @dataclass
 class TimingInfo:
+    __slots__ = ('Phase', 'TimeSegment1_range', 'TimeSegment2_range', 'SyncJumpWidth_range', 'PreScaler_range')
     # Parameters below refer to the following phase
     Phase: CanPhase
     # Ranges for parameters that the device can handle
-    TimeSegment1_range: List[int]
-    TimeSegment2_range: List[int]
-    SyncJumpWidth_range: List[int]
-    PreScaler_range: List[int]
+    TimeSegment1_range: range
+    TimeSegment2_range: range
+    SyncJumpWidth_range: range
+    PreScaler_range: range
 
 
 @dataclass
@@ -143,29 +168,31 @@ class CanDevice:
     setter_offset_ts2: int = 0
     setter_offset_sjw: int = 0
     setter_offset_prescaler: int = 0
+    # baud rates in [bps] supported by the device, derived from the lists above
+    BaudRatesBps: Tuple[int, ...] = field(init=False, repr=False)
+    FDBaudRatesBps: Tuple[int, ...] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.BaudRatesBps = tuple(br*1000 for br in CanBaudRatesKbps if br <= self.MaxBaudRate)
+        self.FDBaudRatesBps = tuple(br*1000 for br in CanFDBaudRatesKbps if br <= self.MaxFDBaudRate)
 
     def _get_timings(
             self,
-            baud_rate_bps: float,
+            baud_rate_bps: int,
             phase=CanPhase.Arbitration,
             target_sjw=3,
             unique=True
     ):
         """Get timings for given baud rate"""
-        timings = calculate_bit_timings(
+        return calculate_bit_timings(
             f_in=self.F_in,
             baud_rate_bps=baud_rate_bps,
             target_sjw=target_sjw,
-            timing_info=self.TimingInfos[phase]
+            timing_info=self.TimingInfos[phase],
+            unique=unique
         )
-        if unique:
-            # filter out the same timings, based on the BitTiming class' selected
-            # attributes defined in BitTiming.__keys(), by applying a set.
-            return list(set(timings))
-        else:
-            return timings
 
-    def get_timings(self, baud_rate_bps: float, target_sjw=3, unique=True):
+    def get_timings(self, baud_rate_bps: int, target_sjw=3, unique=True):
         """Get all timings for given baud rate"""
         return self._get_timings(baud_rate_bps=baud_rate_bps, phase=CanPhase.Arbitration, target_sjw=target_sjw,
                                  unique=unique)
@@ -194,12 +221,123 @@ class CanDevice:
         return next((t for t in timings if _min < t.SamplePoint < _max), None)
 
 
+def _sample_point_ts1_window(
+        time_quanta_per_bit_time: int,
+        sample_point_min: float,
+        sample_point_max: float
+) -> Tuple[int, int]:
+    """
+    TS1 range for the given TQ/BT whose sample points are inside the sample point range.
+
+    The ceil/floor estimate can be off by one because of float rounding
+    (e.g. 64.4 * 250 / 100 == 161.00000000000003), so the edges are corrected with
+    the same float expression the SamplePoint of a BitTiming is calculated with.
+
+    :return: (first TS1, last TS1), empty if last < first
+    """
+    sample_point = lambda ts1: (SyncSegment + ts1) / time_quanta_per_bit_time * 100
+    ts1_lo = math.ceil(sample_point_min * time_quanta_per_bit_time / 100) - SyncSegment
+    while sample_point(ts1_lo - 1) >= sample_point_min:
+        ts1_lo -= 1
+    while sample_point(ts1_lo) < sample_point_min:
+        ts1_lo += 1
+    ts1_hi = math.floor(sample_point_max * time_quanta_per_bit_time / 100) - SyncSegment
+    while sample_point(ts1_hi + 1) <= sample_point_max:
+        ts1_hi += 1
+    while sample_point(ts1_hi) > sample_point_max:
+        ts1_hi -= 1
+    return ts1_lo, ts1_hi
+
+
+def _search_bit_timings(
+        f_in: int,
+        baud_rate_bps: int,
+        ts1_min: int,
+        ts1_max: int,
+        ts2_min: int,
+        ts2_max: int,
+        prescaler_min: int,
+        prescaler_max: int,
+        sample_point_min: float,
+        sample_point_max: float
+) -> Tuple[Tuple[float, int, int, int, int], ...]:
+    """
+    Searches the valid (TS1, TS2, prescaler, TQ/BT) combinations.
+
+    Works on plain integer limits only, the BitTiming objects are built by
+    calculate_bit_timings from the returned tuples, which are already in
+    the final order, sorted by the sample point (ascending), then by the
+    prescaler (descending).
+
+    :return: tuple of (sample point, TS1, TS2, prescaler, TQ/BT) tuples
+    """
+    candidates: List[Tuple[float, int, int, int, int]] = []
+    # local names for the globals and methods used in the loops
+    sync = SyncSegment
+    candidates_extend = candidates.extend
+    # Instead of trying every (TS1, TS2) pair, solve for them:
+    #   f_in = prescaler * baud_rate * TQ/BT
+    # so only integer (prescaler, TQ/BT) divisor pairs are usable, and for a given
+    # TQ/BT the sample point range directly bounds TS1 (and TS2 = TQ/BT - SYNC - TS1).
+    # The input clocks per bit (prescaler * TQ/BT) have to be an integer,
+    # otherwise there is no solution at all.
+    clocks_per_bit, remainder = divmod(f_in, baud_rate_bps)
+    if remainder:
+        return ()
+    # prescaler * TQ/BT = clocks per bit: enumerate the divisor pairs through whichever of
+    # the two feasible windows is shorter, only prescalers that give a TQ/BT reachable with
+    # the device's segments, and only TQ/BTs that give a prescaler in the device range
+    # (-(-a // b) is the integer ceil(a / b))
+    time_quanta_min = sync + ts1_min + ts2_min
+    time_quanta_max = sync + ts1_max + ts2_max
+    prescaler_lo = max(prescaler_min, -(-clocks_per_bit // time_quanta_max))
+    prescaler_hi = min(prescaler_max, clocks_per_bit // time_quanta_min)
+    time_quanta_lo = max(time_quanta_min, -(-clocks_per_bit // prescaler_max))
+    time_quanta_hi = min(time_quanta_max, clocks_per_bit // prescaler_min)
+    # both are generated with descending prescalers, which is the secondary sort order
+    if prescaler_hi - prescaler_lo <= time_quanta_hi - time_quanta_lo:
+        divisor_pairs = (
+            (prescaler, clocks_per_bit // prescaler)
+            for prescaler in range(prescaler_hi, prescaler_lo - 1, -1)
+            if clocks_per_bit % prescaler == 0
+        )
+    else:
+        divisor_pairs = (
+            (clocks_per_bit // time_quanta, time_quanta)
+            for time_quanta in range(time_quanta_lo, time_quanta_hi + 1)
+            if clocks_per_bit % time_quanta == 0
+        )
+    for prescaler, time_quanta_per_bit_time in divisor_pairs:
+        # TS1 + TS2 for this TQ/BT
+        time_segments = time_quanta_per_bit_time - sync
+        # every TS1 in this window is a valid timing, no candidates get rejected below:
+        #   - TS1 inside the device range
+        #   - TS2 = TQ/BT - SYNC - TS1 inside the device range
+        #   - SP = (SYNC + TS1) / TQ/BT * 100 inside the sample point range
+        # (if the TQ/BT is not reachable with the device's segments, the window is empty)
+        sp_ts1_lo, sp_ts1_hi = _sample_point_ts1_window(time_quanta_per_bit_time, sample_point_min, sample_point_max)
+        ts1_lo = max(ts1_min, time_segments - ts2_max, sp_ts1_lo)
+        ts1_hi = min(ts1_max, time_segments - ts2_min, sp_ts1_hi)
+        # the whole window at once, TS2 = TQ/BT - SYNC - TS1
+        candidates_extend([
+            ((sync + TS1) / time_quanta_per_bit_time * 100,
+             TS1, time_segments - TS1, prescaler, time_quanta_per_bit_time)
+            for TS1 in range(ts1_lo, ts1_hi + 1)
+        ])
+    # sort based on:
+    #   primary key:    sample point, ascending
+    #   secondary key:  prescaler, descending (the sort is stable, so this is the generation order)
+    candidates.sort(key=itemgetter(0))
+    return tuple(candidates)
+
+
 def calculate_bit_timings(
         f_in: int,
-        baud_rate_bps: float,
+        baud_rate_bps: int,
         target_sjw: int,
         timing_info: TimingInfo,
-        sample_point_range=DefaultSamplePointRange
+        sample_point_range=DefaultSamplePointRange,
+        unique=False
 ) -> List[BitTiming]:
     """
     Calculates bit timing parameters
@@ -267,43 +405,101 @@ def calculate_bit_timings(
     :param target_sjw: target SJW to aim
     :param timing_info: device timing info to calculate with
     :param sample_point_range: range in percent to calculate for.
+    :param unique: filter out the same timings, based on the BitTiming class' selected
+        attributes defined in BitTiming.__keys(), keeping the first one in the sorted order.
 
     :return: list of bit timings
     """
+    # the search does its divisibility checks on integers, so there is no float rounding involved.
+    # A fractional input clock or baud rate cannot be matched with integer prescaler and segments at all.
+    if f_in != int(f_in) or baud_rate_bps != int(baud_rate_bps):
+        return []
+    f_in = int(f_in)
+    baud_rate_bps = int(baud_rate_bps)
+    ts1_range = timing_info.TimeSegment1_range
+    ts2_range = timing_info.TimeSegment2_range
+    return list(_calculate_bit_timings_cached(
+        f_in=f_in,
+        baud_rate_bps=baud_rate_bps,
+        target_sjw=target_sjw,
+        ts1_min=ts1_range[0],
+        ts1_max=ts1_range[-1],
+        ts2_min=ts2_range[0],
+        ts2_max=ts2_range[-1],
+        sjw_max=timing_info.SyncJumpWidth_range[-1],
+        prescaler_min=timing_info.PreScaler_range[0],
+        prescaler_max=timing_info.PreScaler_range[-1],
+        sample_point_min=sample_point_range[0],
+        sample_point_max=sample_point_range[1],
+        unique=unique,
+    ))
+
+
+@lru_cache(maxsize=256)
+def _calculate_bit_timings_cached(
+        f_in: int,
+        baud_rate_bps: int,
+        target_sjw: int,
+        ts1_min: int,
+        ts1_max: int,
+        ts2_min: int,
+        ts2_max: int,
+        sjw_max: int,
+        prescaler_min: int,
+        prescaler_max: int,
+        sample_point_min: float,
+        sample_point_max: float,
+        unique: bool
+) -> Tuple[BitTiming, ...]:
+    """
+    Does the work of calculate_bit_timings on the unpacked TimingInfo limits.
+
+    The results are cached: the GUI recalculates on every baud rate, F_in and
+    SJW change, and the same inputs come up again and again. BitTiming is
+    immutable, so the cached instances can be shared between the callers.
+    """
+    candidates = _search_bit_timings(
+        f_in=f_in,
+        baud_rate_bps=baud_rate_bps,
+        ts1_min=ts1_min,
+        ts1_max=ts1_max,
+        ts2_min=ts2_min,
+        ts2_max=ts2_max,
+        prescaler_min=prescaler_min,
+        prescaler_max=prescaler_max,
+        sample_point_min=sample_point_min,
+        sample_point_max=sample_point_max,
+    )
+    clock_period_sec = 1 / f_in
+    # limit SJW by max_sjw here, and by ts1, ts2 per timing below
+    sjw_limit = min(target_sjw, sjw_max)
     bit_timing_list: List[BitTiming] = []
-    for TS1 in timing_info.TimeSegment1_range:
-        for TS2 in timing_info.TimeSegment2_range:
-            time_quanta_per_bit_time = SyncSegment + TS1 + TS2
-            prescaler = f_in / (baud_rate_bps * time_quanta_per_bit_time)
-            # p * b * t  = f
-            # b = f / (p * t)
-            if prescaler not in timing_info.PreScaler_range:
-                continue
-            prescaler = int(prescaler)
-            time_quantum_sec = (1 / f_in) * prescaler
-            sample_point = (SyncSegment + TS1) / time_quanta_per_bit_time * 100
-            if not sample_point_range[0] <= sample_point <= sample_point_range[1]:
+    bit_timing_list_append = bit_timing_list.append
+    # keys of the timings added so far, duplicates are skipped before creating them
+    seen = set()
+    # the candidates are already in the final order
+    for sample_point, TS1, TS2, prescaler, time_quanta_per_bit_time in candidates:
+        act_sjw = min(sjw_limit, TS1, TS2)
+        if unique:
+            key = (sample_point, act_sjw)
+            if key in seen:
                 continue
-            # limit SJW by ts1, ts2, and max_sjw
-            act_sjw = min(target_sjw, TS1, TS2, timing_info.SyncJumpWidth_range[-1])
-            bt = BitTiming(sample_point, time_quantum_sec, time_quanta_per_bit_time, TS1, TS2, prescaler, act_sjw)
-            bit_timing_list.append(bt)
-    # sort based on:
-    #   primary key:    sample point, ascending
-    #   secondary key:  prescaler, descending
-    bit_timing_list.sort(key=lambda x: (x.SamplePoint, -x.Prescaler))
-    return bit_timing_list
+            seen.add(key)
+        time_quantum_sec = clock_period_sec * prescaler
+        bt = BitTiming(sample_point, time_quantum_sec, time_quanta_per_bit_time, TS1, TS2, prescaler, act_sjw)
+        bit_timing_list_append(bt)
+    return tuple(bit_timing_list)
 
 
-def closed_range(*r) -> List[int]:
+def closed_range(*r) -> range:
     """
     Helper: gives a closed interval
     :param r: two integers: min_val, max_val
-    :return: [min_val, min_val+1, ..., max_val-1, max_val]
+    :return: range of min_val, min_val+1, ..., max_val-1, max_val
     """
     assert len(r) == 2
     start, end = r
-    return list(range(start, end + 1))
+    return range(start, end + 1)
 
 
 CANDeviceXCANFD = CanDevice(
@@ -397,47 +593,169 @@ class Canvas(QtWidgets.QGraphicsView):
         self.setScene(self.scene)
         self.zoom = 0
         self.setRenderHints(QtGui.QPainter.Antialiasing | QtGui.QPainter.SmoothPixmapTransform)
+        # drawing resources, these do not change between draws
+        self.pen = QtGui.QPen(QtCore.Qt.black)
+        self.synBrush = QtGui.QBrush(QtCore.Qt.gray, QtCore.Qt.SolidPattern)
+        self.ts1Brush = QtGui.QBrush(QtCore.Qt.cyan, QtCore.Qt.SolidPattern)
+        self.ts2Brush = QtGui.QBrush(QtCore.Qt.magenta, QtCore.Qt.SolidPattern)
+        self.labelFont = QtGui.QFont('arial', 8)
+        # The scene items are created once (in drawing order) and only moved and
+        # reshaped by draw(), instead of clearing and recreating the scene each time.
+        pen = self.pen
+        font = self.labelFont
+        self.synRect = self.scene.addRect(QtCore.QRectF(), pen, self.synBrush)
+        self.synText = self.scene.addText('SYN', font)
+        self.ts1Text = self.scene.addText('TSEG1 (PROP+PHASE1)', font)
+        self.ts1Path = self.scene.addPath(QtGui.QPainterPath(), pen, self.ts1Brush)
+        self.ts2Text = self.scene.addText('TSEG2 (PHASE2)', font)
+        self.samplePointLine = self.scene.addLine(QtCore.QLineF(), pen)
+        self.sjwMinusLine = self.scene.addLine(QtCore.QLineF(), pen)
+        self.sjwPlusLine = self.scene.addLine(QtCore.QLineF(), pen)
+        self.samplePointText = self.scene.addText('Sampling point', font)
+        self.sjwMinusText = self.scene.addText('-SJW', font)
+        self.sjwPlusText = self.scene.addText('+SJW', font)
+        self.ts2Path = self.scene.addPath(QtGui.QPainterPath(), pen, self.ts2Brush)
+        self.drawItems = (
+            self.synRect, self.synText, self.ts1Text, self.ts1Path, self.ts2Text,
+            self.samplePointLine, self.sjwMinusLine, self.sjwPlusLine,
+            self.samplePointText, self.sjwMinusText, self.sjwPlusText, self.ts2Path,
+        )
+        self.clear()
+
+    @staticmethod
+    def quantaPath(x: float, count: int, w: float, h: float) -> QtGui.QPainterPath:
+        """
+        One path for `count` time quanta starting at `x`, so a segment is a single
+        scene item instead of one rect item per time quantum.
+        The segment is one filled rect with the quantum borders as lines inside,
+        so the shared borders are not stroked twice.
+        """
+        path = QtGui.QPainterPath()
+        if count <= 0:
+            return path
+        path.addRect(QtCore.QRectF(x, 0, count * w, h))
+        for tq in range(1, count):
+            path.moveTo(x + tq * w, 0)
+            path.lineTo(x + tq * w, h)
+        return path
+
+    def clear(self):
+        """Hides the visualization"""
+        for item in self.drawItems:
+            item.setVisible(False)
 
     def draw(self, bitTiming: BitTiming):
-        self.scene.clear()
-        pen = QtGui.QPen(QtCore.Qt.black)
-        synBrush = QtGui.QBrush(QtCore.Qt.gray, QtCore.Qt.SolidPattern)
-        ts1Brush = QtGui.QBrush(QtCore.Qt.cyan, QtCore.Qt.SolidPattern)
-        ts2Brush = QtGui.QBrush(QtCore.Qt.magenta, QtCore.Qt.SolidPattern)
         _w = self.width() * 0.9
         w = _w / bitTiming.TimeQuantaPerBitTime
         h = 20
-        size = QtCore.QSizeF(w, h)
+        sjw = bitTiming.SyncJumpWidthActual
         x = 0
-        font = QtGui.QFont('arial', 8)
-        self.scene.addRect(QtCore.QRectF(x, 0, w, h), pen, synBrush)
-        self.scene.addText('SYN', font).setPos(x + w/2 - 5, -2*h)
+        self.synRect.setRect(QtCore.QRectF(x, 0, w, h))
+        self.synText.setPos(x + w/2 - 5, -2*h)
         x += w
-        self.scene.addText('TSEG1 (PROP+PHASE1)', font).setPos(x + bitTiming.TS1*w/2 - 5, -2*h)
-        for tq in range(bitTiming.TS1):
-            pos = QtCore.QPointF(x, 0)
-            x += w
-            rect = QtCore.QRectF(pos, size)
-            self.scene.addRect(rect, pen, ts1Brush)
-        self.scene.addText('TSEG2 (PHASE2)', font).setPos(x + bitTiming.TS2 * w / 2 - 5, -2*h)
+        self.ts1Text.setPos(x + bitTiming.TS1*w/2 - 5, -2*h)
+        self.ts1Path.setPath(self.quantaPath(x, bitTiming.TS1, w, h))
+        x += bitTiming.TS1 * w
+        self.ts2Text.setPos(x + bitTiming.TS2 * w / 2 - 5, -2*h)
         # sample point marker line:
-        self.scene.addLine(x, 0, x, h*3, pen)
-        self.scene.addLine(x - w*bitTiming.SyncJumpWidthActual, 0, x - w*bitTiming.SyncJumpWidthActual, h * 2, pen)
-        self.scene.addLine(x + w * bitTiming.SyncJumpWidthActual, 0, x + w * bitTiming.SyncJumpWidthActual, h * 2, pen)
-        self.scene.addText('Sampling point', font).setPos(x - 25, 3*h)
-        self.scene.addText('-SJW', font).setPos(x - 20 - w*bitTiming.SyncJumpWidthActual, 2 * h)
-        self.scene.addText('+SJW', font).setPos(x - 20 + w*bitTiming.SyncJumpWidthActual, 2 * h)
-        for tq in range(bitTiming.TS2):
-            pos = QtCore.QPointF(x, 0)
-            x += w
-            rect = QtCore.QRectF(pos, size)
-            self.scene.addRect(rect, pen, ts2Brush)
+        self.samplePointLine.setLine(x, 0, x, h*3)
+        self.sjwMinusLine.setLine(x - w*sjw, 0, x - w*sjw, h * 2)
+        self.sjwPlusLine.setLine(x + w * sjw, 0, x + w * sjw, h * 2)
+        self.samplePointText.setPos(x - 25, 3*h)
+        self.sjwMinusText.setPos(x - 20 - w*sjw, 2 * h)
+        self.sjwPlusText.setPos(x - 20 + w*sjw, 2 * h)
+        self.ts2Path.setPath(self.quantaPath(x, bitTiming.TS2, w, h))
+        for item in self.drawItems:
+            item.setVisible(True)
 
     def wheelEvent(self, event: QtGui.QWheelEvent):
         adj = 1/(event.angleDelta().y() / 120) * 0.1
         self.scale(1 + adj, 1 + adj)
 
 
+def device_setter(raw_value: int, setter_offset: int) -> str:
+    """
+    Helper: the value to write into the device register, if it differs from the raw value
+    :param raw_value: bit timing parameter value
+    :param setter_offset: device specific offset of the register value
+    :return: text for the bit timing table, or empty string
+    """
+    return f"(device setvalue: {raw_value + setter_offset})" if setter_offset != 0 and raw_value > 0 else ""
+
+
+class BitTimingModel(QtCore.QAbstractTableModel):
+    """
+    Table model for the calculated bit timings: the cell texts are formatted
+    once per result list, no per cell items are allocated.
+    """
+    labels = (
+        'Sample point [%]',
+        'Time quantum [ns]',
+        'TQ/BitTime',
+        'TimeSegment1',
+        'TimeSegment2',
+        'Prescaler',
+        'SJW actual'
+    )
+
+    def __init__(self):
+        super().__init__()
+        self.bitTimings: List[BitTiming] = []
+        # formatted cell texts, one tuple per bit timing
+        self.rows: List[Tuple[str, ...]] = []
+
+    def setBitTimings(self, device: CanDevice, bitTimings: List[BitTiming]):
+        self.beginResetModel()
+        self.bitTimings = bitTimings
+        self.rows = self.formatRows(device, bitTimings) if bitTimings else []
+        self.endResetModel()
+
+    def clear(self):
+        self.setBitTimings(None, [])
+
+    def bitTiming(self, row: int) -> BitTiming:
+        return self.bitTimings[row]
+
+    @staticmethod
+    def formatRows(device: CanDevice, bitTimings: List[BitTiming]) -> List[Tuple[str, ...]]:
+        so_ts1 = device.setter_offset_ts1
+        so_ts2 = device.setter_offset_ts2
+        so_prescaler = device.setter_offset_prescaler
+        so_sjw = device.setter_offset_sjw
+        return [
+            (
+                f'{bitTiming.SamplePoint:.3f}',
+                f'{bitTiming.TimeQuantumSec*1e9:.3f}',
+                f'{bitTiming.TimeQuantaPerBitTime}',
+                f'{bitTiming.TS1:<6}{device_setter(bitTiming.TS1, so_ts1)}',
+                f'{bitTiming.TS2:<6}{device_setter(bitTiming.TS2, so_ts2)}',
+                f'{bitTiming.Prescaler:<6}{device_setter(bitTiming.Prescaler, so_prescaler)}',
+                f'{bitTiming.SyncJumpWidthActual:<6}{device_setter(bitTiming.SyncJumpWidthActual, so_sjw)}',
+            )
+            for bitTiming in bitTimings
+        ]
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.labels)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.labels[section]
+        return None
+
+    def data(self, index: QtCore.QModelIndex, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.DisplayRole:
+            return None
+        return self.rows[index.row()][index.column()]
+
+
 class MainWindow(QtWidgets.QWidget):
     """
     Main GUI window
@@ -447,6 +765,18 @@ class MainWindow(QtWidgets.QWidget):
         self.app = app
         self.currentBaudRateBps: int = None
         self.currentPhase: CanPhase = None
+        # F_in and SJW changes are debounced: holding the spin box arrow or typing
+        # a multi digit value only triggers one calculation after the last change
+        self.calcTimer = QtCore.QTimer(self)
+        self.calcTimer.setSingleShot(True)
+        self.calcTimer.setInterval(120)
+        self.calcTimer.timeout.connect(self.calculate)
+        # the canvas follows the table's current row, debounced as well, so
+        # scrolling through the rows with the keyboard only redraws at the end
+        self.drawTimer = QtCore.QTimer(self)
+        self.drawTimer.setSingleShot(True)
+        self.drawTimer.setInterval(50)
+        self.drawTimer.timeout.connect(self.drawCurrentBitTiming)
         self.initUI()
 
     def initUI(self):
@@ -493,21 +823,11 @@ class MainWindow(QtWidgets.QWidget):
         self.dataBaudRateLay.addWidget(QtWidgets.QLabel('Data Phase Baud rates [kbps]'))
         self.dataBaudRateLay.addWidget(self.dataBaudRateList)
 
-        self.bitTimingTable = QtWidgets.QTableWidget()
-        labels = (
-            'Sample point [%]',
-            'Time quantum [ns]',
-            'TQ/BitTime',
-            'TimeSegment1',
-            'TimeSegment2',
-            'Prescaler',
-            'SJW actual'
-        )
-        self.bitTimingTable.setColumnCount(len(labels))
-        self.bitTimingTable.setHorizontalHeaderLabels(labels)
+        self.bitTimingModel = BitTimingModel()
+        self.bitTimingTable = QtWidgets.QTableView()
+        self.bitTimingTable.setModel(self.bitTimingModel)
         self.bitTimingTable.verticalHeader().setVisible(False)
-        self.bitTimingTable.clearContents()
-        self.bitTimingTable.setSelectionBehavior(QtWidgets.QTableWidget.SelectRows)
+        self.bitTimingTable.setSelectionBehavior(QtWidgets.QTableView.SelectRows)
         header = self.bitTimingTable.horizontalHeader()
         header.setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
 
@@ -539,7 +859,7 @@ class MainWindow(QtWidgets.QWidget):
         self.dataBaudRateList.itemClicked.connect(self.baudRateListClicked)
         self.dataBaudRateList.currentItemChanged.connect(self.baudRateChanged)
 
-        self.bitTimingTable.currentCellChanged.connect(self.updateVisualization)
+        self.bitTimingTable.selectionModel().currentRowChanged.connect(self.updateVisualization)
         self.f_in_MHz_value.valueChanged.connect(self.finChanged)
         self.sjw_value.valueChanged.connect(self.sjwChanged)
 
@@ -555,14 +875,7 @@ class MainWindow(QtWidgets.QWidget):
         phase: CanPhase = None
         baudRateBps: int = None
         phase, baudRateBps = item.data(QtCore.Qt.UserRole)
-        doCalc = False
-        if phase != self.currentPhase:
-            doCalc = True
-        self.currentPhase = phase
-        self.currentBaudRateBps = baudRateBps
-        self.btParamLabel.setText(f'{self.BT_PARAM_LABEL} for {self.currentPhase.name} phase')
-        if doCalc:
-            self.calculate()
+        self.selectBaudRate(phase, baudRateBps)
 
     @QtCore.pyqtSlot(int)
     def finChanged(self, value: int):
@@ -575,17 +888,20 @@ class MainWindow(QtWidgets.QWidget):
             self.f_in_MHz_value.setStyleSheet('background-color: #aef;')
         else:
             self.f_in_MHz_value.setStyleSheet('background-color: white;')
-        self.calculate()
+        self.calcTimer.start()
 
     @QtCore.pyqtSlot(int)
     def sjwChanged(self, value: int):
-        self.calculate()
+        self.calcTimer.start()
 
-    @QtCore.pyqtSlot(int)
-    def updateVisualization(self, row):
-        if row >= 0:
-            item = self.bitTimingTable.item(row, 0)
-            bitTiming = item.data(QtCore.Qt.UserRole)
+    @QtCore.pyqtSlot(QtCore.QModelIndex, QtCore.QModelIndex)
+    def updateVisualization(self, current: QtCore.QModelIndex, previous: QtCore.QModelIndex):
+        self.drawTimer.start()
+
+    def drawCurrentBitTiming(self):
+        current = self.bitTimingTable.currentIndex()
+        if current.isValid():
+            bitTiming = self.bitTimingModel.bitTiming(current.row())
             self.canvas.draw(bitTiming)
 
     @QtCore.pyqtSlot(QtWidgets.QListWidgetItem)
@@ -597,18 +913,17 @@ class MainWindow(QtWidgets.QWidget):
         self.btParamLabel.setText(self.BT_PARAM_LABEL)
         self.arbitrationBaudRateList.clear()
         self.dataBaudRateList.clear()
-        self.bitTimingTable.clearContents()
-        self.bitTimingTable.setRowCount(0)
-        self.canvas.scene.clear()
+        self.bitTimingModel.clear()
+        self.canvas.clear()
         device: CanDevice = item.data(QtCore.Qt.UserRole)
         self.f_in_MHz_value.setValue(int(device.F_in / 1e6))
         self.f_in_MHz_value.setStyleSheet('background-color: white;')
         for timingInfo in device.TimingInfos.values():
             if timingInfo.Phase is CanPhase.Arbitration:
-                brList = [br*1000 for br in CanBaudRatesKbps if br <= device.MaxBaudRate]
+                brList = device.BaudRatesBps
                 listWidget = self.arbitrationBaudRateList
             elif timingInfo.Phase is CanPhase.Data:
-                brList = [br*1000 for br in CanFDBaudRatesKbps if br <= device.MaxFDBaudRate]
+                brList = device.FDBaudRatesBps
                 listWidget = self.dataBaudRateList
             else:
                 raise TypeError
@@ -624,8 +939,20 @@ class MainWindow(QtWidgets.QWidget):
         phase: CanPhase = None
         baudRateBps: int = None
         phase, baudRateBps = item.data(QtCore.Qt.UserRole)
+        self.selectBaudRate(phase, baudRateBps)
+
+    def selectBaudRate(self, phase: CanPhase, baudRateBps: int):
+        """
+        Common handler of the baud rate lists.
+        A mouse click emits both currentItemChanged and itemClicked (the latter is
+        needed to switch back to the already current item of the other phase's list),
+        so only recalculate if the selection really changed.
+        """
+        if (phase, baudRateBps) == (self.currentPhase, self.currentBaudRateBps):
+            return
         self.currentPhase = phase
         self.currentBaudRateBps = baudRateBps
+        self.btParamLabel.setText(f'{self.BT_PARAM_LABEL} for {self.currentPhase.name} phase')
         self.calculate()
 
     def calculate(self):
@@ -636,16 +963,10 @@ class MainWindow(QtWidgets.QWidget):
             return
         device: CanDevice = deviceItem.data(QtCore.Qt.UserRole)
 
-        self.bitTimingTable.setEnabled(False)
-        self.app.processEvents()
-        self.bitTimingTable.clearContents()
-        self.canvas.scene.clear()
-        self.bitTimingTable.setRowCount(0)
+        self.canvas.clear()
         f_in = int(self.f_in_MHz_value.value() * 1e6)
-        timingInfo = None
-        for _timingInfo in device.TimingInfos.values():
-            if _timingInfo.Phase == self.currentPhase:
-                timingInfo = _timingInfo
+        timingInfo = device.TimingInfos.get(self.currentPhase)
+        bitTimingList: List[BitTiming] = []
         if timingInfo is not None:
             bitTimingList = calculate_bit_timings(
                 f_in=f_in,
@@ -653,28 +974,8 @@ class MainWindow(QtWidgets.QWidget):
                 target_sjw=self.sjw_value.value(),
                 timing_info=timingInfo
             )
-            for row, bitTiming in enumerate(bitTimingList):
-                self.bitTimingTable.insertRow(row)
-                item = QtWidgets.QTableWidgetItem(f'{bitTiming.SamplePoint:.3f}')
-                item.setData(QtCore.Qt.UserRole, bitTiming)
-                self.bitTimingTable.setItem(row, 0, item)
-                self.bitTimingTable.setItem(row, 1, QtWidgets.QTableWidgetItem(f'{bitTiming.TimeQuantumSec*1e9:.3f}'))
-                self.bitTimingTable.setItem(row, 2, QtWidgets.QTableWidgetItem(f'{bitTiming.TimeQuantaPerBitTime}'))
-                device_setter = lambda rv, so: f"(device setvalue: {rv + so})" if so != 0 and rv > 0 else ""
-                self.bitTimingTable.setItem(row, 3, QtWidgets.QTableWidgetItem(
-                    f'{bitTiming.TS1:<6}{device_setter(bitTiming.TS1, device.setter_offset_ts1)}'
-                ))
-                self.bitTimingTable.setItem(row, 4, QtWidgets.QTableWidgetItem(
-                    f'{bitTiming.TS2:<6}{device_setter(bitTiming.TS2, device.setter_offset_ts2)}'
-                ))
-                self.bitTimingTable.setItem(row, 5, QtWidgets.QTableWidgetItem(
-                    f'{bitTiming.Prescaler:<6}{device_setter(bitTiming.Prescaler, device.setter_offset_prescaler)}'
-                ))
-                self.bitTimingTable.setItem(row, 6, QtWidgets.QTableWidgetItem(
-                    f'{bitTiming.SyncJumpWidthActual:<6}{device_setter(bitTiming.SyncJumpWidthActual, device.setter_offset_sjw)}'
-                ))
-        self.bitTimingTable.setEnabled(True)
-        self.app.processEvents()
+        # one model reset instead of constructing an item per table cell
+        self.bitTimingModel.setBitTimings(device, bitTimingList)
 
 
 def open_app():
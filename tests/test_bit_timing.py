@@ -0,0 +1,119 @@
+import copy
+import pickle
+
+import pytest
+
+pytest.importorskip('PyQt5')
+
+from can_bit_timing_calculator.can_bit_timing_calculator import (  # noqa: E402
+    CANDeviceXCANFD,
+    CANDeviceXCANPS,
+    CanPhase,
+    SyncSegment,
+    TimingInfo,
+    calculate_bit_timings,
+    closed_range,
+)
+
+
+SmallTimingInfo = TimingInfo(
+    Phase=CanPhase.Arbitration,
+    TimeSegment1_range=closed_range(2, 16),
+    TimeSegment2_range=closed_range(1, 8),
+    SyncJumpWidth_range=closed_range(1, 4),
+    PreScaler_range=closed_range(2, 40),
+)
+
+
+def brute_force_bit_timings(f_in, baud_rate_bps, target_sjw, timing_info, sample_point_range):
+    """Reference: scan every (TS1, TS2) pair, as the original implementation did"""
+    rows = []
+    for TS1 in timing_info.TimeSegment1_range:
+        for TS2 in timing_info.TimeSegment2_range:
+            time_quanta_per_bit_time = SyncSegment + TS1 + TS2
+            prescaler, remainder = divmod(f_in, baud_rate_bps * time_quanta_per_bit_time)
+            if remainder or prescaler not in timing_info.PreScaler_range:
+                continue
+            sample_point = (SyncSegment + TS1) / time_quanta_per_bit_time * 100
+            if not sample_point_range[0] <= sample_point <= sample_point_range[1]:
+                continue
+            act_sjw = min(target_sjw, TS1, TS2, timing_info.SyncJumpWidth_range[-1])
+            rows.append(
+                (sample_point, (1 / f_in) * prescaler, time_quanta_per_bit_time, TS1, TS2, prescaler, act_sjw)
+            )
+    rows.sort(key=lambda x: (x[0], -x[5]))
+    return rows
+
+
+def as_rows(bit_timings):
+    return [
+        (bt.SamplePoint, bt.TimeQuantumSec, bt.TimeQuantaPerBitTime, bt.TS1, bt.TS2, bt.Prescaler,
+         bt.SyncJumpWidthActual)
+        for bt in bit_timings
+    ]
+
+
+@pytest.mark.parametrize('clone', [
+    copy.copy,
+    copy.deepcopy,
+    lambda bt: pickle.loads(pickle.dumps(bt)),
+])
+def test_bit_timing_copy_and_pickle_round_trip(clone):
+    bit_timing = CANDeviceXCANPS.get_timings(500000)[0]
+    cloned = clone(bit_timing)
+    assert cloned == bit_timing
+    assert hash(cloned) == hash(bit_timing)
+    assert repr(cloned) == repr(bit_timing)
+
+
+def test_module_docstring_example():
+    # 80 MHz, prescaler 8 -> 100 ns time quantum, TSEG1 = 15, TSEG2 = 4 -> 500 kbps, 80 %
+    timings = calculate_bit_timings(80000000, 500000, 1, CANDeviceXCANPS.TimingInfos[CanPhase.Arbitration])
+    matches = [bt for bt in timings if (bt.TS1, bt.TS2, bt.Prescaler) == (15, 4, 8)]
+    assert len(matches) == 1
+    assert matches[0].TimeQuantaPerBitTime == 20
+    assert matches[0].SamplePoint == pytest.approx(80)
+    assert matches[0].TimeQuantumSec == pytest.approx(100e-9)
+
+
+@pytest.mark.parametrize('f_in', [24000000, 36000000, 40000000, 80000000])
+@pytest.mark.parametrize('baud_rate_bps', [125000, 250000, 500000, 1000000])
+@pytest.mark.parametrize('sample_point_range', [(50, 100), (64.4, 100), (70.1, 87.3), (75, 87.5)])
+def test_matches_brute_force_scan(f_in, baud_rate_bps, sample_point_range):
+    expected = brute_force_bit_timings(f_in, baud_rate_bps, 3, SmallTimingInfo, sample_point_range)
+    actual = calculate_bit_timings(f_in, baud_rate_bps, 3, SmallTimingInfo, sample_point_range)
+    assert as_rows(actual) == expected
+
+
+def test_fractional_sample_point_bound_is_exact():
+    # 64.4 * 250 / 100 == 161.00000000000003: TS1 = 160 at TQ/BT = 250 is exactly at the bound
+    timing_info = CANDeviceXCANFD.TimingInfos[CanPhase.Arbitration]
+    expected = brute_force_bit_timings(36000000, 144000, 1, timing_info, (64.4, 100))
+    actual = calculate_bit_timings(36000000, 144000, 1, timing_info, sample_point_range=(64.4, 100))
+    assert as_rows(actual) == expected
+    assert any((bt.TS1, bt.TS2, bt.TimeQuantaPerBitTime) == (160, 89, 250) for bt in actual)
+
+
+@pytest.mark.parametrize('device', [CANDeviceXCANFD, CANDeviceXCANPS])
+def test_float_f_in_gives_the_same_timings(device):
+    # e.g. F_in given as 36e6: both enumeration branches used to get the float
+    timing_info = device.TimingInfos[CanPhase.Arbitration]
+    expected = calculate_bit_timings(device.F_in, 500000, 1, timing_info)
+    actual = calculate_bit_timings(float(device.F_in), 500000, 1, timing_info)
+    assert expected
+    assert as_rows(actual) == as_rows(expected)
+    assert all(isinstance(bt.TimeQuantaPerBitTime, int) for bt in actual)
+
+
+def test_fractional_f_in_gives_no_timings():
+    timing_info = CANDeviceXCANPS.TimingInfos[CanPhase.Arbitration]
+    assert calculate_bit_timings(80000000.5, 500000, 1, timing_info) == []
+
+
+def test_fractional_baud_rate_gives_no_timings():
+    # int() used to truncate 500000.5 to 500000 and return its timings
+    timing_info = CANDeviceXCANPS.TimingInfos[CanPhase.Arbitration]
+    assert calculate_bit_timings(80000000, 500000.5, 1, timing_info) == []
+    expected = calculate_bit_timings(80000000, 500000, 1, timing_info)
+    assert expected
+    assert as_rows(calculate_bit_timings(80000000, 500000.0, 1, timing_info)) == as_rows(expected)